@@ -3,7 +3,18 @@ Built-in command implementations for the Interactive Python Shell.
 """
 
 import os
-from config import BUILT_IN_COMMANDS
+import shutil
+from config import BUILT_IN_COMMANDS, DIR_PREFIX, FILE_PREFIX
+
+_HELP_TEXT = (
+    "Available commands:\n"
+    "  Built-in: echo, pwd, cd, ls, mkdir, touch, cat, clear, type, history, exit\n"
+    "  Pipelines: Use | to chain commands (e.g., 'ls | cat')\n"
+    "  History: 'history' to view, 'history -r <file>' to read, 'history -w <file>' to write\n"
+    "           'history -a <file>' to append new entries\n"
+    "  Use the file browser on the left to navigate\n"
+    "  Double-click folders to cd into them"
+)
 
 
 class BuiltInCommands:
@@ -17,6 +28,27 @@ class BuiltInCommands:
             history_manager: HistoryManager instance for history command
         """
         self.history_manager = history_manager
+        
+        # Map command names to handlers once so execute() is a single lookup
+        self._dispatch = {
+            "help": lambda args: self._help(),
+            "echo": self._echo,
+            "pwd": lambda args: self._pwd(),
+            "cd": self._cd,
+            "ls": self._ls,
+            "mkdir": self._mkdir,
+            "touch": self._touch,
+            "cat": self._cat,
+            "type": self._type,
+            "history": self._history,
+        }
+        
+        # Resolved executable paths for 'type', valid for the PATH they were
+        # looked up under. Only hits are kept, so a command installed later
+        # is still found.
+        self._which_path = None
+        self._which_cacheable = False
+        self._which_cache = {}
     
     def execute(self, command, args):
         """
@@ -29,40 +61,12 @@ class BuiltInCommands:
         Returns:
             str: Command output or None for commands that don't produce output
         """
-        if command == "help":
-            return self._help()
-        elif command == "echo":
-            return self._echo(args)
-        elif command == "pwd":
-            return self._pwd()
-        elif command == "cd":
-            return self._cd(args)
-        elif command == "ls":
-            return self._ls(args)
-        elif command == "mkdir":
-            return self._mkdir(args)
-        elif command == "touch":
-            return self._touch(args)
-        elif command == "cat":
-            return self._cat(args)
-        elif command == "type":
-            return self._type(args)
-        elif command == "history":
-            return self._history(args)
-        else:
-            return f"{command}: unknown command"
+        handler = self._dispatch.get(command)
+        return handler(args) if handler else f"{command}: unknown command"
     
     def _help(self):
         """Display help information"""
-        return (
-            "Available commands:\n"
-            "  Built-in: echo, pwd, cd, ls, mkdir, touch, cat, clear, type, history, exit\n"
-            "  Pipelines: Use | to chain commands (e.g., 'ls | cat')\n"
-            "  History: 'history' to view, 'history -r <file>' to read, 'history -w <file>' to write\n"
-            "           'history -a <file>' to append new entries\n"
-            "  Use the file browser on the left to navigate\n"
-            "  Double-click folders to cd into them"
-        )
+        return _HELP_TEXT
     
     def _echo(self, args):
         """Print arguments to output"""
@@ -89,15 +93,14 @@ class BuiltInCommands:
         """List directory contents"""
         try:
             path = args[0] if args else "."
-            items = os.listdir(path)
-            result = []
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
             
-            for item in sorted(items):
-                full_path = os.path.join(path, item)
-                if os.path.isdir(full_path):
-                    result.append(f"📁 {item}/")
-                else:
-                    result.append(f"📄 {item}")
+            # DirEntry.is_dir() reuses the type info from the directory read
+            result = [
+                DIR_PREFIX + e.name + "/" if e.is_dir() else FILE_PREFIX + e.name
+                for e in entries
+            ]
             
             return "\n".join(result) if result else "(empty directory)"
         except Exception as e:
@@ -145,15 +148,38 @@ class BuiltInCommands:
         if args[0] in BUILT_IN_COMMANDS:
             return f"{args[0]} is a shell builtin"
         else:
-            # Search PATH for the command
+            # Search PATH for the command, reusing earlier lookups while
+            # PATH is unchanged
             path_env = os.environ.get("PATH", "")
-            directories = path_env.split(os.pathsep)
             
-            for directory in directories:
-                full_path = os.path.join(directory, args[0])
-                if os.path.isfile(full_path) and os.access(full_path, os.X_OK):
-                    return f"{args[0]} is {full_path}"
+            # shutil.which resolves names containing a separator against the
+            # cwd, so the answer could change after cd. Search only PATH
+            # directories for those, uncached.
+            if os.sep in args[0] or (os.altsep and os.altsep in args[0]):
+                resolved = ""
+                for directory in path_env.split(os.pathsep):
+                    full_path = os.path.join(directory, args[0])
+                    if os.path.isfile(full_path) and os.access(full_path, os.X_OK):
+                        resolved = full_path
+                        break
+            else:
+                if path_env != self._which_path:
+                    self._which_cache.clear()
+                    self._which_path = path_env
+                    # A relative entry ('.' or an empty one) gives answers
+                    # that depend on the cwd, so those PATHs are never cached
+                    self._which_cacheable = all(
+                        os.path.isabs(d) for d in path_env.split(os.pathsep)
+                    )
+                
+                resolved = self._which_cache.get(args[0])
+                if resolved is None:
+                    resolved = shutil.which(args[0], path=path_env) or ""
+                    if resolved and self._which_cacheable:
+                        self._which_cache[args[0]] = resolved
             
+            if resolved:
+                return f"{args[0]} is {resolved}"
             return f"{args[0]}: not found"
     
     def _history(self, args):
@@ -5,10 +5,18 @@ Configuration and constants for the Interactive Python Shell.
 import platform
 
 # Commands that are built into this shell (not external programs)
-BUILT_IN_COMMANDS = (
+BUILT_IN_COMMANDS = frozenset({
     "echo", "exit", "type", "pwd", "cd", "history",
     "ls", "mkdir", "touch", "cat", "clear"
-)
+})
+
+# Built-ins that can change what the file browser shows ('history -w/-a'
+# write files). External commands are assumed to change it as well.
+MUTATING_COMMANDS = frozenset({"mkdir", "touch", "cd", "history"})
+
+# Prefixes used when listing directory entries
+DIR_PREFIX = "📁 "
+FILE_PREFIX = "📄 "
 
 # Platform detection
 IS_MAC = platform.system() == 'Darwin'
@@ -56,6 +64,10 @@ class GUIConfig:
 # Command execution settings
 SUBPROCESS_TIMEOUT = 5  # seconds
 
+# History persistence settings
+HISTORY_FLUSH_THRESHOLD = 16  # pending commands before appending to HISTFILE
+HISTORY_FLUSH_INTERVAL = 1.0  # idle seconds before buffered commands are appended
+
 # Welcome message
 WELCOME_MESSAGE = """Welcome to Interactive Python Shell!
 Current directory: {cwd}
@@ -3,9 +3,9 @@ Command execution engine for the Interactive Python Shell.
 Handles both built-in commands and external programs, including pipelines.
 """
 
-import sys
-import io
 import subprocess
+import tempfile
+import time
 from config import BUILT_IN_COMMANDS, SUBPROCESS_TIMEOUT
 
 
@@ -34,8 +34,9 @@ class CommandExecutor:
         if not parts:
             return ""
         
-        # Check if it's a pipeline (has | symbol)
-        if '|' in parts:
+        # Check if it's a pipeline (has | symbol). A single token can't be
+        # one, so skip scanning for the common bare-command case.
+        if len(parts) > 1 and '|' in parts:
             return self._execute_pipeline(parts)
         else:
             return self._execute_single(parts)
@@ -69,63 +70,82 @@ class CommandExecutor:
         if not commands:
             return ""
         
-        # Run each command in sequence
-        prev_output = None
+        # Run each command in sequence. Consecutive external commands are
+        # connected with OS pipes so they run concurrently and stream
+        # into each other instead of buffering every stage in memory.
+        output = ""
+        i = 0
         
-        for i, cmd_parts in enumerate(commands):
-            if not cmd_parts:
-                continue
-            
-            is_last = (i == len(commands) - 1)
-            command = cmd_parts[0]
+        while i < len(commands):
+            command = commands[i][0]
             
             # Handle built-in commands
             if command in BUILT_IN_COMMANDS:
-                # Capture output by redirecting stdout
-                old_stdout = sys.stdout
-                sys.stdout = io.StringIO()
+                # Built-ins return their output directly
+                output = self._execute_single(commands[i]) or ""
+                i += 1
+                continue
+            
+            # Handle a run of external commands
+            procs = []
+            
+            # The whole run of stages shares one timeout
+            deadline = time.monotonic() + SUBPROCESS_TIMEOUT
+            try:
+                stdin = None
+                if output:
+                    # Feed the previous built-in's output to the first process
+                    stdin = tempfile.TemporaryFile()
+                    stdin.write(output.encode())
+                    stdin.seek(0)
                 
-                try:
-                    self._execute_single(cmd_parts)
-                    output = sys.stdout.getvalue()
-                finally:
-                    sys.stdout = old_stdout
+                while i < len(commands) and commands[i][0] not in BUILT_IN_COMMANDS:
+                    command = commands[i][0]
+                    try:
+                        procs.append(subprocess.Popen(
+                            commands[i],
+                            stdin=stdin,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT
+                        ))
+                    finally:
+                        # The child has its own copy; closing ours lets
+                        # earlier stages see SIGPIPE if a later one exits
+                        if stdin is not None:
+                            stdin.close()
+                    stdin = procs[-1].stdout
+                    i += 1
                 
-                if is_last:
-                    return output.strip()
-                else:
-                    prev_output = output
-            
-            # Handle external commands
-            else:
-                try:
-                    stdin_data = prev_output.encode() if prev_output else None
-                    
-                    result = subprocess.run(
-                        cmd_parts,
-                        input=stdin_data,
-                        capture_output=True,
-                        text=False,
-                        timeout=SUBPROCESS_TIMEOUT
-                    )
-                    
-                    output = result.stdout.decode()
-                    if result.stderr:
-                        output += result.stderr.decode()
-                    
-                    if is_last:
-                        return output.strip()
-                    else:
-                        prev_output = output
-                        
-                except FileNotFoundError:
-                    return f"{command}: command not found"
-                except subprocess.TimeoutExpired:
-                    return f"{command}: command timed out"
-                except Exception as e:
-                    return f"{command}: {str(e)}"
+                # Every stage launched; later failures belong to the run as
+                # a whole rather than to the last command started
+                command = "pipeline"
+                
+                result, _ = procs[-1].communicate(
+                    timeout=max(0, deadline - time.monotonic())
+                )
+                for proc in procs[:-1]:
+                    proc.wait(timeout=max(0, deadline - time.monotonic()))
+                output = result.decode('utf-8', errors='replace')
+                
+            except FileNotFoundError:
+                return f"{command}: command not found"
+            except subprocess.TimeoutExpired:
+                # Name the earliest stage still running; the ones after it
+                # are usually just waiting on its output
+                stuck = next((p for p in procs if p.poll() is None), procs[-1])
+                return f"{stuck.args[0]}: command timed out"
+            except Exception as e:
+                return f"{command}: {str(e)}"
+            finally:
+                for proc in procs:
+                    if proc.poll() is None:
+                        proc.kill()
+                        proc.wait()
+                    # communicate() leaves the last pipe open if it timed out
+                    if proc.stdout is not None:
+                        proc.stdout.close()
         
-        return ""
+        return output.strip()
     
     def _execute_single(self, parts):
         """
@@ -150,13 +170,14 @@ class CommandExecutor:
                 result = subprocess.run(
                     parts,
                     capture_output=True,
-                    text=True,
+                    text=False,
                     timeout=SUBPROCESS_TIMEOUT
                 )
                 
-                output = result.stdout
+                # Decode each stream once in bulk
+                output = result.stdout.decode('utf-8', errors='replace')
                 if result.stderr:
-                    output += result.stderr
+                    output += result.stderr.decode('utf-8', errors='replace')
                 
                 return output.strip() if output else f"Command completed (exit code: {result.returncode})"
             except FileNotFoundError:
@@ -5,7 +5,10 @@ GUI components for the Interactive Python Shell.
 import os
 import tkinter as tk
 from tkinter import ttk, scrolledtext
-from config import GUIConfig, IS_MAC, WELCOME_MESSAGE
+from config import (
+    GUIConfig, IS_MAC, WELCOME_MESSAGE, BUILT_IN_COMMANDS, MUTATING_COMMANDS,
+    DIR_PREFIX, FILE_PREFIX
+)
 from parser import CommandParser
 from history_manager import HistoryManager
 from commands import BuiltInCommands
@@ -35,6 +38,13 @@ class ShellGUI:
         self.executor = CommandExecutor(self.builtin_commands)
         self.parser = CommandParser()
         
+        # (cwd, mtime) of the directory last shown in the file browser
+        self._last_refresh_key = None
+        
+        # Terminal output waiting to be inserted on the next idle cycle
+        self._out_buf = []
+        self._out_after_id = None
+        
         # Build the interface
         self._create_layout()
         self._show_welcome()
@@ -88,6 +98,16 @@ class ShellGUI:
         )
         self.file_tree.configure(yscrollcommand=tree_scroll.set)
         
+        # Tcl helper that inserts a flat (text, name, kind, ...) list of rows
+        # in one call, instead of one Python -> Tcl round trip per row
+        self.root.tk.eval(
+            'proc ::shell_fill_tree {tree items} {'
+            '  foreach {text name kind} $items {'
+            '    $tree insert {} end -text $text -values [list $name $kind]'
+            '  }'
+            '}'
+        )
+        
         self.file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
@@ -111,7 +131,7 @@ class ShellGUI:
         ttk.Button(
             action_frame,
             text="🔄 Refresh",
-            command=self.refresh_tree
+            command=lambda: self.refresh_tree(force=True)
         ).pack(side=tk.LEFT, padx=2)
     
     def _create_terminal(self, parent):
@@ -167,17 +187,30 @@ class ShellGUI:
     
     def _clear_terminal(self):
         """Clear the terminal display"""
+        self._out_buf.clear()
         self.terminal.delete(1.0, tk.END)
     
     def write_output(self, text):
         """
         Write text to the terminal and auto-scroll to bottom.
         
+        Writes are buffered and inserted together once Tk is idle, so a
+        command's echo and its output reach the widget in a single insert.
+        
         Args:
             text (str): Text to display
         """
-        self.terminal.insert(tk.END, text)
-        self.terminal.see(tk.END)
+        self._out_buf.append(text)
+        if self._out_after_id is None:
+            self._out_after_id = self.root.after_idle(self._flush_output)
+    
+    def _flush_output(self):
+        """Insert all buffered output into the terminal at once"""
+        self._out_after_id = None
+        if self._out_buf:
+            self.terminal.insert(tk.END, "".join(self._out_buf))
+            self._out_buf.clear()
+            self.terminal.see(tk.END)
     
     def execute_command(self, event=None):
         """Main entry point when user runs a command"""
@@ -187,7 +220,7 @@ class ShellGUI:
         
         # Handle special commands first
         if command == "exit":
-            self.history_manager.save_to_histfile()
+            self.history_manager.commit_history()
             self.root.quit()
             return
         
@@ -216,34 +249,50 @@ class ShellGUI:
             self.write_output(f"Error: {str(e)}\n")
         
         # Refresh file browser in case files changed
-        self.refresh_tree()
+        head = parts[0]
+        if head in MUTATING_COMMANDS or head not in BUILT_IN_COMMANDS or '|' in parts:
+            self.refresh_tree()
     
-    def refresh_tree(self):
-        """Update the file browser to show current directory"""
+    def refresh_tree(self, force=False):
+        """
+        Update the file browser to show current directory.
+        
+        Skips the rebuild when neither the working directory nor its
+        modification time changed since the last refresh.
+        
+        Args:
+            force (bool): Rebuild even if the directory looks unchanged
+        """
+        cwd = os.getcwd()
+        try:
+            key = (cwd, os.stat('.').st_mtime_ns)
+        except OSError:
+            key = None
+        
+        if not force and key is not None and key == self._last_refresh_key:
+            return
+        self._last_refresh_key = key
+        
         self.file_tree.delete(*self.file_tree.get_children())
-        self.current_dir_var.set(os.getcwd())
+        self.current_dir_var.set(cwd)
+        
+        # Add ".." to go up one level
+        rows = [DIR_PREFIX + "..", "..", "dir"]
         
         try:
-            # Add ".." to go up one level
-            self.file_tree.insert('', 'end', text="📁 ..", values=('..', 'dir'))
-            
             # List everything in current directory
-            items = os.listdir('.')
-            for item in sorted(items):
-                if os.path.isdir(item):
-                    self.file_tree.insert(
-                        '', 'end',
-                        text=f"📁 {item}",
-                        values=(item, 'dir')
-                    )
+            with os.scandir('.') as it:
+                entries = sorted(it, key=lambda e: e.name)
+            
+            for entry in entries:
+                if entry.is_dir():
+                    rows.extend((DIR_PREFIX + entry.name, entry.name, 'dir'))
                 else:
-                    self.file_tree.insert(
-                        '', 'end',
-                        text=f"📄 {item}",
-                        values=(item, 'file')
-                    )
+                    rows.extend((FILE_PREFIX + entry.name, entry.name, 'file'))
         except PermissionError:
             self.write_output("Permission denied to list directory\n")
+        
+        self.root.tk.call('::shell_fill_tree', str(self.file_tree), tuple(rows))
     
     def on_tree_double_click(self, event):
         """Handle double-click on folders to navigate"""
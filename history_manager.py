@@ -4,6 +4,12 @@ Handles storing, loading, and navigating command history.
 """
 
 import os
+import queue
+import threading
+from config import HISTORY_FLUSH_THRESHOLD, HISTORY_FLUSH_INTERVAL
+
+# Tells the HISTFILE writer thread to flush and exit
+_STOP = object()
 
 
 class HistoryManager:
@@ -15,21 +21,38 @@ class HistoryManager:
         self.saved_count = 0
         self.current_index = 0
         
-        # Try to load history from HISTFILE if it exists
-        self._load_from_histfile()
+        # HISTFILE writes happen on a background thread so the GUI
+        # never waits on disk I/O. The thread is started by the first
+        # command queued for HISTFILE.
+        self._write_q = queue.Queue()
+        self._writer = None
+        
+        # HISTFILE is read on first use rather than at startup
+        self._loaded = False
+    
+    def _ensure_loaded(self):
+        """Load history from HISTFILE the first time it is needed"""
+        if not self._loaded:
+            self._loaded = True
+            self._load_from_histfile()
     
     def _load_from_histfile(self):
         """Load history from HISTFILE environment variable if set"""
         histfile_env = os.environ.get("HISTFILE")
         if histfile_env and os.path.exists(histfile_env):
             try:
-                with open(histfile_env, 'r') as f:
-                    self.history = [line.strip() for line in f if line.strip()]
-                    self.saved_count = len(self.history)
-                    self.current_index = len(self.history)
+                self.history = self._read_lines(histfile_env)
+                self.saved_count = len(self.history)
+                self.current_index = len(self.history)
             except Exception:
                 pass
     
+    @staticmethod
+    def _read_lines(filepath):
+        """Read a history file in one pass, skipping blank lines"""
+        with open(filepath, 'r') as f:
+            return [line for line in map(str.strip, f.read().splitlines()) if line]
+    
     def add(self, command):
         """
         Add a command to history.
@@ -37,8 +60,54 @@ class HistoryManager:
         Args:
             command (str): Command to add
         """
+        self._ensure_loaded()
         self.history.append(command)
         self.current_index = len(self.history)
+        
+        if os.environ.get("HISTFILE"):
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop, daemon=True
+                )
+                self._writer.start()
+            self._write_q.put(command)
+    
+    def _writer_loop(self):
+        """Append queued commands to HISTFILE in batches (runs on a thread)"""
+        pending = []
+        while True:
+            # Wait indefinitely when idle, otherwise flush after the interval
+            timeout = HISTORY_FLUSH_INTERVAL if pending else None
+            try:
+                item = self._write_q.get(timeout=timeout)
+            except queue.Empty:
+                self._append_to_histfile(pending)
+                pending = []
+                continue
+            
+            if item is _STOP:
+                self._append_to_histfile(pending)
+                return
+            
+            pending.append(item)
+            if len(pending) >= HISTORY_FLUSH_THRESHOLD:
+                self._append_to_histfile(pending)
+                pending = []
+    
+    def _append_to_histfile(self, commands):
+        """
+        Append commands to HISTFILE in a single write.
+        
+        Only writes what was queued; saved_count belongs to the
+        'history -r/-w/-a' file operations and is left untouched.
+        """
+        histfile = os.environ.get("HISTFILE")
+        if histfile and commands:
+            try:
+                with open(histfile, 'a') as f:
+                    f.write("\n".join(commands) + "\n")
+            except Exception:
+                pass
     
     def get_previous(self, current_text=""):
         """
@@ -50,6 +119,7 @@ class HistoryManager:
         Returns:
             str or None: Previous command or None if at start
         """
+        self._ensure_loaded()
         if self.current_index > 0:
             self.current_index -= 1
             return self.history[self.current_index]
@@ -62,6 +132,7 @@ class HistoryManager:
         Returns:
             str or None: Next command or None if at end
         """
+        self._ensure_loaded()
         if self.current_index < len(self.history) - 1:
             self.current_index += 1
             return self.history[self.current_index]
@@ -81,10 +152,10 @@ class HistoryManager:
         Returns:
             int: Number of commands loaded
         """
-        with open(filepath, 'r') as f:
-            self.history = [line.strip() for line in f if line.strip()]
-            self.saved_count = len(self.history)
-            self.current_index = len(self.history)
+        self.history = self._read_lines(filepath)
+        self._loaded = True
+        self.saved_count = len(self.history)
+        self.current_index = len(self.history)
         return len(self.history)
     
     def write_to_file(self, filepath):
@@ -97,9 +168,10 @@ class HistoryManager:
         Returns:
             int: Number of commands written
         """
+        self._ensure_loaded()
         with open(filepath, 'w') as f:
-            for cmd in self.history:
-                f.write(cmd + '\n')
+            if self.history:
+                f.write("\n".join(self.history) + "\n")
         self.saved_count = len(self.history)
         return len(self.history)
     
@@ -113,22 +185,21 @@ class HistoryManager:
         Returns:
             int: Number of new commands appended
         """
+        self._ensure_loaded()
         current_len = len(self.history)
         new_items = current_len - self.saved_count
         
         if new_items > 0:
             with open(filepath, 'a') as f:
-                for cmd in self.history[-new_items:]:
-                    f.write(cmd + '\n')
+                f.write("\n".join(self.history[-new_items:]) + "\n")
             self.saved_count = current_len
         
         return new_items
     
-    def save_to_histfile(self):
-        """Save history to HISTFILE if environment variable is set"""
-        histfile = os.environ.get("HISTFILE")
-        if histfile:
-            try:
-                self.write_to_file(histfile)
-            except Exception:
-                pass
\ No newline at end of file
+    def commit_history(self):
+        """Flush buffered commands to HISTFILE and stop the writer thread"""
+        if self._writer is not None and self._writer.is_alive():
+            self._write_q.put(_STOP)
+            self._writer.join()
+        # Let the next add() start a fresh writer
+        self._writer = None
\ No newline at end of file
@@ -3,80 +3,160 @@ Command line parser for the Interactive Python Shell.
 Handles quote parsing, escape characters, and tokenization.
 """
 
+import functools
+import re
 
-class CommandParser:
+# Characters that end a run of plain text outside quotes / inside "..."
+_UNQUOTED_SPECIAL = re.compile(r"[ '\"\\]")
+_DOUBLE_QUOTED_SPECIAL = re.compile(r'["\\]')
+
+
+def _tokenize(text):
     """
-    Parses command input handling quotes and escape characters.
-    Example: 'echo "hello world"' -> ['echo', 'hello world']
+    Tokenize a command line.
+    
+    Rather than stepping one character at a time, the scanner jumps to the
+    next quote, backslash or space and copies the text in between as a
+    single slice.
+    
+    Args:
+        text (str): Raw command input
+        
+    Returns:
+        tuple: Parsed tokens (a tuple so cached results can't be mutated)
     """
+    # Fast path: with no quotes or escapes, splitting on spaces is all
+    # there is to do. Only ' ' separates words, so tabs stay in tokens.
+    if "'" not in text and '"' not in text and '\\' not in text:
+        return tuple(filter(None, text.split(' ')))
+    
+    parts = []
+    token = []
+    i = 0
+    
+    # Hoist loop invariants out of the scanning loop
+    n = len(text)
+    append_part = parts.append
+    append_tok = token.append
+    find_special = _UNQUOTED_SPECIAL.search
+    find_dq_special = _DOUBLE_QUOTED_SPECIAL.search
+    find = text.find
     
-    @staticmethod
-    def parse(text):
-        """
-        Parse command input into tokens.
+    while i < n:
+        # Copy the run of plain characters up to the next special one
+        match = find_special(text, i)
+        j = match.start() if match else n
+        if j > i:
+            # A whole word with nothing to unquote is emitted as one slice,
+            # skipping the token list and join
+            if not token and (j == n or text[j] == ' '):
+                append_part(text[i:j])
+                i = j + 1
+                continue
+            append_tok(text[i:j])
+        if j == n:
+            break
         
-        Args:
-            text (str): Raw command input
-            
-        Returns:
-            list: List of parsed tokens
-        """
-        parts = []
-        token = []
-        in_single_quote = False
-        in_double_quote = False
-        i = 0
+        curr_char = text[j]
         
-        while i < len(text):
-            curr_char = text[i]
-            
-            # Handle single quotes
-            if curr_char == "'" and not in_double_quote:
-                in_single_quote = not in_single_quote
-                i += 1
-            
-            # Handle double quotes
-            elif curr_char == '"' and not in_single_quote:
-                in_double_quote = not in_double_quote
-                i += 1
-            
-            # Space outside quotes = word boundary
-            elif curr_char == ' ' and not in_single_quote and not in_double_quote:
-                if token:
-                    parts.append("".join(token))
-                    token = []
-                i += 1
-            
-            # Backslash escape outside quotes
-            elif curr_char == '\\' and not in_single_quote and not in_double_quote:
-                if i + 1 < len(text):
-                    next_char = text[i+1]
-                    token.append(next_char)
-                    i += 2
-                else:
-                    i += 1
-            
-            # Backslash escape inside double quotes (only for " and \)
-            elif curr_char == '\\' and not in_single_quote:
-                if i + 1 < len(text):
-                    next_char = text[i+1]
-                    if next_char in ('"', '\\'):
-                        token.append(next_char)
-                        i += 2
-                    else:
-                        token.append(curr_char)
-                        i += 1
+        # Space outside quotes = word boundary
+        if curr_char == ' ':
+            if token:
+                append_part("".join(token))
+                token.clear()
+            i = j + 1
+        
+        # Single quotes: everything up to the closing quote is literal
+        elif curr_char == "'":
+            end = find("'", j + 1)
+            if end == -1:
+                end = n
+            if end > j + 1:
+                append_tok(text[j + 1:end])
+            i = end + 1
+        
+        # Double quotes: copy the runs between escapes up to the closing quote
+        elif curr_char == '"':
+            i = j + 1
+            while i < n:
+                match = find_dq_special(text, i)
+                end = match.start() if match else n
+                if end > i:
+                    append_tok(text[i:end])
+                if end == n:
+                    i = n
+                elif text[end] == '"':
+                    i = end + 1
+                    break
+                # Backslash escape inside double quotes (only for " and \)
+                elif end + 1 < n and text[end + 1] in '"\\':
+                    append_tok(text[end + 1])
+                    i = end + 2
                 else:
-                    token.append(curr_char)
-                    i += 1
-            
-            # Regular character
-            else:
-                token.append(curr_char)
-                i += 1
+                    append_tok('\\')
+                    i = end + 1
+        
+        # Backslash escape outside quotes
+        else:
+            if j + 1 < n:
+                append_tok(text[j + 1])
+            i = j + 2
+    
+    # Don't forget last token
+    if token:
+        parts.append("".join(token))
+    
+    return tuple(parts)
+
+
+# Cached tokenizer for interactive input, so the same line typed again
+# (e.g. re-run from history) skips the scan
+_parse_tokens = functools.lru_cache(maxsize=512)(_tokenize)
+
+
+def parse(text):
+    """
+    Parse command input into tokens.
+    
+    Args:
+        text (str): Raw command input
         
-        # Don't forget last token
-        if token:
-            parts.append("".join(token))
+    Returns:
+        list: List of parsed tokens
+    """
+    return list(_parse_tokens(text))
+
+
+def parse_many(texts):
+    """
+    Parse several command lines in one call.
+    
+    Meant for bulk input such as scripts or history files. Lines are
+    tokenized without going through the cache, so a large batch doesn't
+    evict recently typed commands.
+    
+    Args:
+        texts (iterable): Raw command lines
         
-        return parts
\ No newline at end of file
+    Returns:
+        list: One list of parsed tokens per input line
+    """
+    tokenize = _tokenize
+    return [list(tokenize(text)) for text in texts]
+
+
+class CommandParser:
+    """
+    Parses command input handling quotes and escape characters.
+    Example: 'echo "hello world"' -> ['echo', 'hello world']
+    """
+    
+    # The parser keeps no per-instance state; the method is the module
+    # function itself so calls skip an extra Python frame
+    parse = staticmethod(parse)
+    parse_many = staticmethod(parse_many)
+    
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached parse results"""
+        _parse_tokens.cache_clear()
\ No newline at end of file